@@ -1,5 +1,7 @@
 """StayHere webhook management library for Python."""
 
+from typing import TYPE_CHECKING, Any
+
 from .client import StayHereWebhookClient
 from .errors import (
     StayHereError,
@@ -9,8 +11,12 @@ from .errors import (
 )
 from .models import Webhook, WebhookSecretBundle, InvokeResult
 
+if TYPE_CHECKING:
+    from .async_client import AsyncStayHereWebhookClient
+
 __all__ = [
     "StayHereWebhookClient",
+    "AsyncStayHereWebhookClient",
     "StayHereError",
     "StayHereHTTPError",
     "StayHereAuthError",
@@ -21,4 +27,13 @@ __all__ = [
 ]
 
 __version__ = "0.1.0"
-__author__ = "Tamino1230"
\ No newline at end of file
+__author__ = "Tamino1230"
+
+def __getattr__(name: str) -> Any:
+    # The async client pulls in aiohttp, which is slow to import; load it on first use.
+    if name == "AsyncStayHereWebhookClient":
+        from .async_client import AsyncStayHereWebhookClient
+
+        globals()[name] = AsyncStayHereWebhookClient
+        return AsyncStayHereWebhookClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
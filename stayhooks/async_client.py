@@ -0,0 +1,340 @@
+"""asyncio flavour of the StayHere webhook client, backed by aiohttp."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Dict, Iterable, Literal, Optional, Sequence, Tuple
+
+try:  # optional dependency, only needed for the async client
+    import aiohttp
+except ImportError:  # pragma: no cover - depends on the environment
+    aiohttp = None
+
+from .client import WEBHOOK_SECRET_HEADER, _BaseWebhookClient
+from .errors import StayHereError
+from .models import InvokeResult, PermittedActions, Webhook, WebhookSecretBundle
+
+
+class AsyncStayHereWebhookClient(_BaseWebhookClient):
+    """Async counterpart of :class:`StayHereWebhookClient` for concurrent fan-out."""
+
+    __slots__ = ("_session",)
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        *,
+        token: Optional[str] = None,
+        api_prefix: str = "/api",
+        timeout: float = 10.0,
+        user_agent: str = "stayhere-webhooks/0.1",
+        default_alias: Optional[str] = None,
+        wire_format: Literal["json", "cbor"] = "json",
+        list_webhooks_ttl: float = 60.0,
+    ) -> None:
+        if aiohttp is None:
+            raise StayHereError(
+                "AsyncStayHereWebhookClient requires aiohttp (pip install aiohttp)"
+            )
+        super().__init__(
+            base_url,
+            token=token,
+            api_prefix=api_prefix,
+            timeout=timeout,
+            user_agent=user_agent,
+            default_alias=default_alias,
+            wire_format=wire_format,
+            list_webhooks_ttl=list_webhooks_ttl,
+        )
+        self._session: Optional["aiohttp.ClientSession"] = None
+
+    async def close(self) -> None:
+        """Close the underlying aiohttp session, if one was opened."""
+
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncStayHereWebhookClient":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    # ------------------------------------------------------------------
+    # Public helpers
+    # ------------------------------------------------------------------
+    async def list_webhooks(self, room_id: str) -> Dict[str, Any]:
+        """Return metadata + dataclass objects for every webhook in a room.
+
+        Results are cached per room for ``list_webhooks_ttl`` seconds.
+        """
+
+        cached = self._cached_hooks(room_id)
+        if cached is not None:
+            return cached
+        generation = self._hooks_generation(room_id)
+        data = await self._request("GET", f"/webhooks/{self._encode(room_id)}")
+        hooks = [Webhook.from_dict(item) for item in data.get("webhooks") or ()]
+        return self._store_hooks(
+            room_id,
+            {
+                "room_id": data.get("roomId"),
+                "limit": data.get("limit"),
+                "webhooks": hooks,
+            },
+            generation,
+        )
+
+    async def create_webhook(
+        self,
+        room_id: str,
+        *,
+        label: str,
+        permissions: Optional[Sequence[str]] = None,
+    ) -> WebhookSecretBundle:
+        payload = {
+            "label": label,
+            "permissions": self._normalize_permissions(permissions),
+        }
+        try:
+            data = await self._request("POST", f"/webhooks/{self._encode(room_id)}", body=payload)
+        finally:
+            self._invalidate_hooks(room_id)
+        return WebhookSecretBundle.from_dict(data)
+
+    async def update_webhook(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        label: Optional[str] = None,
+        permissions: Optional[Sequence[str]] = None,
+        paused: Optional[bool] = None,
+    ) -> Webhook:
+        payload: Dict[str, Any] = {}
+        if label is not None:
+            payload["label"] = label
+        if permissions is not None:
+            payload["permissions"] = self._normalize_permissions(permissions)
+        if paused is not None:
+            payload["paused"] = bool(paused)
+        try:
+            data = await self._request(
+                "PATCH",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
+                body=payload or None,
+            )
+        finally:
+            self._invalidate_hooks(room_id)
+        return Webhook.from_dict(data.get("webhook", data))
+
+    async def rotate_secret(self, room_id: str, webhook_id: str) -> WebhookSecretBundle:
+        try:
+            data = await self._request(
+                "POST",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}/rotate",
+            )
+        finally:
+            self._invalidate_hooks(room_id)
+        return WebhookSecretBundle.from_dict(data)
+
+    async def delete_webhook(self, room_id: str, webhook_id: str) -> bool:
+        try:
+            data = await self._request(
+                "DELETE",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
+            )
+        finally:
+            self._invalidate_hooks(room_id)
+        return bool(data.get("ok", True))
+
+    async def get_permitted_actions(self, room_id: str) -> PermittedActions:
+        data = await self._request(
+            "GET",
+            f"/webhooks/{self._encode(room_id)}/meta/permitted-actions",
+        )
+        return PermittedActions.from_dict(data)
+
+    # ------------------------------------------------------------------
+    # Invocation helpers
+    # ------------------------------------------------------------------
+    async def invoke_webhook(
+        self,
+        *,
+        secret: str,
+        action: str,
+        payload: Dict[str, Any],
+        room_id: Optional[str] = None,
+        webhook_id: Optional[str] = None,
+        invoke_url: Optional[str] = None,
+    ) -> InvokeResult:
+        full_url = self._invoke_url(room_id, webhook_id, invoke_url)
+        headers = {WEBHOOK_SECRET_HEADER: secret}
+        data = await self._request(
+            "POST",
+            full_url=full_url,
+            raw_body=self._invoke_body(action, payload),
+            headers=headers,
+            auth=False,
+        )
+        return InvokeResult.from_dict(data)
+
+    async def send_message(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        text: str,
+        alias: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> InvokeResult:
+        return await self.invoke_webhook(
+            room_id=room_id,
+            webhook_id=webhook_id,
+            secret=secret,
+            action="message",
+            payload=self._message_payload(text, alias, extra),
+        )
+
+    async def send_message_fast(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        text: str,
+    ) -> InvokeResult:
+        """Send a plain message using the client's ``default_alias``.
+
+        The request body is assembled from a pre-serialized envelope, so only
+        ``text`` is encoded per call. Use :meth:`send_message` for per-call
+        aliases or extra payload fields.
+        """
+
+        data = await self._request(
+            "POST",
+            full_url=self._invoke_url(room_id, webhook_id, None),
+            raw_body=self._message_body(text),
+            headers={WEBHOOK_SECRET_HEADER: secret},
+            auth=False,
+        )
+        return InvokeResult.from_dict(data)
+
+    async def send_embed(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        color: Optional[str] = None,
+        url: Optional[str] = None,
+        image: Optional[str] = None,
+        footer: Optional[str] = None,
+        text: Optional[str] = None,
+        alias: Optional[str] = None,
+        notes: Optional[Iterable[str]] = None,
+        extra_embed_fields: Optional[Dict[str, Any]] = None,
+    ) -> InvokeResult:
+        payload = self._embed_payload(
+            title=title,
+            description=description,
+            color=color,
+            url=url,
+            image=image,
+            footer=footer,
+            text=text,
+            alias=alias,
+            notes=notes,
+            extra_embed_fields=extra_embed_fields,
+        )
+        return await self.invoke_webhook(
+            room_id=room_id,
+            webhook_id=webhook_id,
+            secret=secret,
+            action="embed",
+            payload=payload,
+        )
+
+    async def send_poll(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        question: str,
+        options: Sequence[str],
+        multiple_choice: bool = False,
+        ends_in_minutes: Optional[int] = None,
+    ) -> InvokeResult:
+        return await self.invoke_webhook(
+            room_id=room_id,
+            webhook_id=webhook_id,
+            secret=secret,
+            action="poll",
+            payload=self._poll_payload(question, options, multiple_choice, ends_in_minutes),
+        )
+
+    async def send_image(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        url: str,
+        size: Optional[Tuple[int, int]] = None,
+        position: Optional[Tuple[int, int]] = None,
+    ) -> InvokeResult:
+        return await self.invoke_webhook(
+            room_id=room_id,
+            webhook_id=webhook_id,
+            secret=secret,
+            action="image",
+            payload=self._image_payload(url, size, position),
+        )
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    def _get_session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            # trust_env picks up HTTP(S)_PROXY / NO_PROXY like the sync transports.
+            self._session = aiohttp.ClientSession(trust_env=True)
+        return self._session
+
+    async def _request(
+        self,
+        method: str,
+        path: Optional[str] = None,
+        *,
+        full_url: Optional[str] = None,
+        body: Optional[Dict[str, Any]] = None,
+        raw_body: Optional[bytes] = None,
+        headers: Optional[Dict[str, str]] = None,
+        auth: bool = True,
+    ) -> Dict[str, Any]:
+        url = full_url or self._build_url(path or "/")
+        if raw_body is not None:
+            data: Optional[bytes] = raw_body
+        else:
+            data = self._serialize(body) if body else None
+        req_headers = self._request_headers(data, headers, auth)
+        try:
+            async with self._get_session().request(
+                method.upper(),
+                url,
+                data=data,
+                headers=req_headers,
+                # Per request, so later changes to ``timeout`` apply to an open session.
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            ) as resp:
+                status = resp.status
+                raw = await resp.read()
+        except aiohttp.ClientError as exc:
+            raise StayHereError(f"Failed to reach StayHere server: {exc}")
+        except asyncio.TimeoutError:
+            raise StayHereError(f"Request to StayHere server timed out after {self.timeout}s")
+        return self._parse_response(status, raw)
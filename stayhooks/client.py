@@ -2,9 +2,44 @@
 
 from __future__ import annotations
 
+import base64
+import http.client
 import json
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
-from urllib import error, parse, request
+import select
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:  # optional speedup, falls back to the stdlib json module
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+try:  # optional connection pooling (HTTP keep-alive)
+    import urllib3
+except ImportError:  # pragma: no cover - depends on the environment
+    urllib3 = None
+
+try:  # optional CBOR wire format
+    import cbor2
+except ImportError:  # pragma: no cover - depends on the environment
+    cbor2 = None
 
 from .errors import (
     StayHereAuthError,
@@ -17,10 +52,114 @@ from .models import InvokeResult, PermittedActions, Webhook, WebhookSecretBundle
 
 WEBHOOK_SECRET_HEADER = "x-stay-webhook-secret"
 DEFAULT_PERMISSIONS = ("message", "embed", "poll", "image")
+_DEFAULT_PERMISSIONS_SET = frozenset(DEFAULT_PERMISSIONS)
+_CONTENT_TYPES = {"json": "application/json", "cbor": "application/cbor"}
+_DECODE_ERRORS: Tuple[type, ...] = (ValueError,)
+if cbor2 is not None:
+    _DECODE_ERRORS += (cbor2.CBORDecodeError,)
+_INVOKE_URL_CACHE_SIZE = 1024
+_HOOKS_CACHE_SIZE = 256
+_BULLET = "• "
+_MAX_IDLE_CONNECTIONS = 16
+_HAS_POLL = hasattr(select, "poll")  # not available on Windows
+_MAX_REDIRECTS = 10
+_REDIRECT_STATUSES = frozenset({301, 302, 303, 307, 308})
+# Credentials that must not follow a redirect to another origin.
+_REDIRECT_STRIP_HEADERS = frozenset(
+    {"authorization", "proxy-authorization", "cookie", WEBHOOK_SECRET_HEADER}
+)
+if urllib3 is not None:
+    # Only GET/HEAD follow redirects through urllib3; see _send_pooled.
+    _SAFE_METHOD_RETRIES = urllib3.Retry(
+        total=None,
+        connect=3,
+        read=3,
+        redirect=_MAX_REDIRECTS,
+        remove_headers_on_redirect=_REDIRECT_STRIP_HEADERS,
+    )
+# Only these may be re-sent after the connection fails mid-request.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+# Common empty acknowledgements that parse to "no data"; skip the decoder for them.
+_EMPTY_BODIES = frozenset({b"", b"{}", b"null", "", "{}", "null"})
+# Pre-serialized '{"action":...,"payload":' envelopes for the built-in actions.
+_ACTION_PREFIXES = {
+    action: f'{{"action":"{action}","payload":'.encode("ascii") for action in DEFAULT_PERMISSIONS
+}
 
+# Percent-encoding table matching urllib.parse.quote(value, safe=""): only the
+# RFC 3986 unreserved characters pass through untouched.
+_UNRESERVED = frozenset(b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~")
+_QUOTE_TABLE = tuple(chr(b) if b in _UNRESERVED else f"%{b:02X}" for b in range(256))
 
-class StayHereWebhookClient:
-    """Manage StayHere webhooks and send payloads programmatically."""
+
+@lru_cache(maxsize=1024)
+def _quote_segment(value: str) -> str:
+    if value.isascii() and value.isalnum():
+        return value
+    table = _QUOTE_TABLE
+    return "".join([table[b] for b in value.encode("utf-8")])
+
+
+def _normalize_proxy(proxy: str) -> str:
+    return proxy if "://" in proxy else f"http://{proxy}"
+
+
+def _proxy_headers(proxy: str) -> Dict[str, str]:
+    parts = urlsplit(proxy)
+    if parts.username is None:
+        return {}
+    credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+    token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+    return {"Proxy-Authorization": f"Basic {token}"}
+
+
+def _json_dumps(obj: Any) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+if orjson is not None:
+
+    def _dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson is stricter than json.dumps (e.g. integers beyond 64 bits);
+            # fall back so both code paths accept the same payloads.
+            return _json_dumps(obj)
+
+    _loads = orjson.loads
+else:  # pragma: no cover - depends on the environment
+    _dumps = _json_dumps
+    # json.loads already reuses the module's shared JSONDecoder when called
+    # without options, so there is no decoder instance worth caching here.
+    _loads = json.loads
+
+
+class _BaseWebhookClient:
+    """Configuration, payload builders and parsing shared by the sync and async clients."""
+
+    __slots__ = (
+        "_base_url",
+        "_token",
+        "_api_prefix",
+        "_url_base",
+        "timeout",
+        "_user_agent",
+        "_default_alias",
+        "_message_prefix",
+        "_invoke_urls",
+        "_base_headers_noauth",
+        "_base_headers_auth",
+        "_wire_format",
+        "_serialize",
+        "_deserialize",
+        "list_webhooks_ttl",
+        "_hooks_cache",
+        "_hooks_generations",
+        "_hooks_epoch",
+        "_cache_lock",
+        "__weakref__",
+    )
 
     def __init__(
         self,
@@ -31,27 +170,512 @@ class StayHereWebhookClient:
         timeout: float = 10.0,
         user_agent: str = "stayhere-webhooks/0.1",
         default_alias: Optional[str] = None,
+        wire_format: Literal["json", "cbor"] = "json",
+        list_webhooks_ttl: float = 60.0,
     ) -> None:
-        self.base_url = base_url.rstrip("/")
-        self.token = token
-        self.api_prefix = self._normalize_api_prefix(api_prefix)
+        self._set_codec(wire_format)
+        self._base_url = base_url.rstrip("/")
+        self._token = token
+        self._api_prefix = self._normalize_api_prefix(api_prefix)
         self.timeout = timeout
-        self.user_agent = user_agent
+        self._user_agent = user_agent
         self.default_alias = default_alias
+        self._invoke_urls: Dict[Tuple[str, str], str] = {}
+        self.list_webhooks_ttl = list_webhooks_ttl
+        self._hooks_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._hooks_generations: Dict[str, int] = {}
+        self._hooks_epoch = 0
+        self._cache_lock = threading.Lock()
+        self._rebuild_url_base()
+        self._rebuild_header_templates()
+
+    @property
+    def wire_format(self) -> str:
+        return self._wire_format
+
+    @wire_format.setter
+    def wire_format(self, value: str) -> None:
+        self._set_codec(value)
+        self._rebuild_header_templates()
+        self._rebuild_message_prefix()
+
+    def _set_codec(self, wire_format: str) -> None:
+        if wire_format not in _CONTENT_TYPES:
+            raise StayHereValidationError(
+                f"wire_format must be one of {sorted(_CONTENT_TYPES)}, got {wire_format!r}"
+            )
+        self._serialize: Callable[[Any], bytes]
+        self._deserialize: Callable[[Union[str, bytes]], Any]
+        if wire_format == "cbor":
+            if cbor2 is None:
+                raise StayHereError("wire_format='cbor' requires cbor2 (pip install cbor2)")
+            self._serialize, self._deserialize = cbor2.dumps, cbor2.loads
+        else:
+            self._serialize, self._deserialize = _dumps, _loads
+        self._wire_format = wire_format
+
+    @property
+    def default_alias(self) -> Optional[str]:
+        return self._default_alias
+
+    @default_alias.setter
+    def default_alias(self, value: Optional[str]) -> None:
+        self._default_alias = value
+        self._rebuild_message_prefix()
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        self._base_url = value.rstrip("/")
+        self._rebuild_url_base()
+
+    @property
+    def api_prefix(self) -> str:
+        return self._api_prefix
+
+    @api_prefix.setter
+    def api_prefix(self, value: str) -> None:
+        self._api_prefix = self._normalize_api_prefix(value)
+        self._rebuild_url_base()
+
+    @property
+    def token(self) -> Optional[str]:
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        self._token = value
+        self._rebuild_header_templates()
+        self._clear_hooks_cache()
+
+    @property
+    def user_agent(self) -> str:
+        return self._user_agent
+
+    @user_agent.setter
+    def user_agent(self, value: str) -> None:
+        self._user_agent = value
+        self._rebuild_header_templates()
+
+    def _rebuild_message_prefix(self) -> None:
+        # Everything in a send_message_fast envelope except the text is fixed per
+        # client, so pre-serialize it once.
+        if self._wire_format != "json":
+            self._message_prefix = None
+        elif self._default_alias:
+            self._message_prefix = (
+                b'{"action":"message","payload":{"alias":'
+                + _dumps(self._default_alias)
+                + b',"text":'
+            )
+        else:
+            self._message_prefix = b'{"action":"message","payload":{"text":'
+
+    def _rebuild_url_base(self) -> None:
+        self._url_base = self._base_url + self._api_prefix
+        self._invoke_urls.clear()
+        self._clear_hooks_cache()
+
+    def _rebuild_header_templates(self) -> None:
+        content_type = _CONTENT_TYPES[self._wire_format]
+        self._base_headers_noauth = {
+            "Accept": content_type,
+            "User-Agent": self._user_agent,
+            "Content-Type": content_type,
+        }
+        self._base_headers_auth: Optional[Dict[str, str]] = (
+            {**self._base_headers_noauth, "Authorization": f"Bearer {self._token}"}
+            if self._token
+            else None
+        )
+
+    # ------------------------------------------------------------------
+    # list_webhooks TTL cache
+    # ------------------------------------------------------------------
+    def _cached_hooks(self, room_id: str) -> Optional[Dict[str, Any]]:
+        if self.list_webhooks_ttl <= 0:
+            return None
+        with self._cache_lock:
+            entry = self._hooks_cache.get(room_id)
+            if entry is None:
+                return None
+            expires_at, result = entry
+            if expires_at <= time.monotonic():
+                del self._hooks_cache[room_id]
+                return None
+        return self._copy_hooks_result(result)
+
+    def _hooks_generation(self, room_id: str) -> Tuple[int, int]:
+        # Taken before fetching; a fetch that raced an invalidation must not be stored.
+        with self._cache_lock:
+            return self._hooks_epoch, self._hooks_generations.get(room_id, 0)
+
+    def _store_hooks(
+        self, room_id: str, result: Dict[str, Any], generation: Tuple[int, int]
+    ) -> Dict[str, Any]:
+        if self.list_webhooks_ttl > 0:
+            expires_at = time.monotonic() + self.list_webhooks_ttl
+            with self._cache_lock:
+                current = (self._hooks_epoch, self._hooks_generations.get(room_id, 0))
+                if current != generation:
+                    return result
+                if room_id not in self._hooks_cache and len(self._hooks_cache) >= _HOOKS_CACHE_SIZE:
+                    del self._hooks_cache[next(iter(self._hooks_cache))]
+                self._hooks_cache[room_id] = (expires_at, self._copy_hooks_result(result))
+        return result
+
+    def _invalidate_hooks(self, room_id: str) -> None:
+        # Called even when the mutating request failed: the server may have applied it.
+        with self._cache_lock:
+            self._hooks_cache.pop(room_id, None)
+            generations = self._hooks_generations
+            if room_id not in generations and len(generations) >= _HOOKS_CACHE_SIZE:
+                # Keep the counters bounded; a new epoch invalidates every pending fetch.
+                generations.clear()
+                self._hooks_epoch += 1
+            generations[room_id] = generations.get(room_id, 0) + 1
+
+    def _clear_hooks_cache(self) -> None:
+        # Cached lists belong to the server and credentials they were fetched with.
+        with self._cache_lock:
+            self._hooks_cache.clear()
+            self._hooks_generations.clear()
+            self._hooks_epoch += 1
+
+    @staticmethod
+    def _copy_hooks_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        hooks = [replace(hook, permissions=list(hook.permissions)) for hook in result["webhooks"]]
+        return {**result, "webhooks": hooks}
+
+    # ------------------------------------------------------------------
+    # Payload builders
+    # ------------------------------------------------------------------
+    def _invoke_url(
+        self,
+        room_id: Optional[str],
+        webhook_id: Optional[str],
+        invoke_url: Optional[str],
+    ) -> str:
+        if invoke_url:
+            return invoke_url
+        if not room_id or not webhook_id:
+            raise StayHereValidationError(
+                "room_id and webhook_id are required when invoke_url is missing"
+            )
+        key = (room_id, webhook_id)
+        cached = self._invoke_urls.get(key)
+        if cached is None:
+            if len(self._invoke_urls) >= _INVOKE_URL_CACHE_SIZE:
+                self._invoke_urls.clear()
+            path = f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}/invoke"
+            cached = self._invoke_urls[key] = self._build_url(path)
+        return cached
+
+    def _message_payload(
+        self,
+        text: str,
+        alias: Optional[str],
+        extra: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        text_value = (text or "").strip()
+        if not text_value:
+            raise StayHereValidationError("Message text must be provided")
+        payload: Dict[str, Any] = {"text": text_value}
+        alias_value = alias or self.default_alias
+        if alias_value:
+            payload["alias"] = alias_value
+        if extra:
+            payload.update(extra)
+        return payload
+
+    def _embed_payload(
+        self,
+        *,
+        title: Optional[str],
+        description: Optional[str],
+        color: Optional[str],
+        url: Optional[str],
+        image: Optional[str],
+        footer: Optional[str],
+        text: Optional[str],
+        alias: Optional[str],
+        notes: Optional[Iterable[str]],
+        extra_embed_fields: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        embed: Dict[str, Any] = {
+            key: value
+            for key, value in (
+                ("title", title),
+                ("description", description),
+                ("color", color),
+                ("url", url),
+                ("image", image),
+                ("footer", footer),
+            )
+            if value
+        }
+        if notes:
+            extra_lines: List[str] = []
+            append = extra_lines.append
+            for note in notes:
+                if note:
+                    stripped = note.strip()
+                    if stripped:
+                        append(stripped)
+            if extra_lines:
+                current_desc = description.strip() if description else ""
+                bullet_block = "\n".join([_BULLET + line for line in extra_lines])
+                embed["description"] = (
+                    f"{current_desc}\n\n{bullet_block}" if current_desc else bullet_block
+                )
+        if extra_embed_fields:
+            embed.update(extra_embed_fields)
+        if not embed:
+            raise StayHereValidationError("Embed payload must include at least one field")
+        payload: Dict[str, Any] = {"embed": embed}
+        if text:
+            payload["text"] = text
+        alias_value = alias or self.default_alias
+        if alias_value:
+            payload["alias"] = alias_value
+        return payload
+
+    def _poll_payload(
+        self,
+        question: str,
+        options: Sequence[str],
+        multiple_choice: bool,
+        ends_in_minutes: Optional[int],
+    ) -> Dict[str, Any]:
+        clean_opts = [opt.strip() for opt in options if opt and opt.strip()]
+        if len(clean_opts) < 2:
+            raise StayHereValidationError("A poll must include at least two options")
+        question_value = (question or "").strip()
+        if not question_value:
+            raise StayHereValidationError("Poll question cannot be empty")
+        payload: Dict[str, Any] = {
+            "question": question_value,
+            "options": clean_opts[:8],
+            "multipleChoice": bool(multiple_choice),
+        }
+        if ends_in_minutes:
+            payload["endsInMinutes"] = int(ends_in_minutes)
+        return payload
+
+    def _image_payload(
+        self,
+        url: str,
+        size: Optional[Tuple[int, int]],
+        position: Optional[Tuple[int, int]],
+    ) -> Dict[str, Any]:
+        img_url = (url or "").strip()
+        if not img_url.startswith("http"):
+            raise StayHereValidationError("Image URL must be an http/https URL")
+        payload: Dict[str, Any] = {"url": img_url}
+        if size:
+            width, height = size
+            payload["w"] = int(width)
+            payload["h"] = int(height)
+        if position:
+            x, y = position
+            payload["x"] = int(x)
+            payload["y"] = int(y)
+        return payload
+
+    # ------------------------------------------------------------------
+    # Request / response helpers
+    # ------------------------------------------------------------------
+    def _invoke_body(self, action: str, payload: Dict[str, Any]) -> bytes:
+        prefix = _ACTION_PREFIXES.get(action) if self.wire_format == "json" else None
+        if prefix is None:
+            return self._serialize({"action": action, "payload": payload})
+        return prefix + _dumps(payload) + b"}"
+
+    def _message_body(self, text: str) -> bytes:
+        text_value = (text or "").strip()
+        if not text_value:
+            raise StayHereValidationError("Message text must be provided")
+        if self._message_prefix is None:
+            return self._invoke_body("message", self._message_payload(text_value, None, None))
+        return self._message_prefix + _dumps(text_value) + b"}}"
+
+    def _request_headers(
+        self,
+        data: Optional[bytes],
+        headers: Optional[Dict[str, str]],
+        auth: bool,
+    ) -> Dict[str, str]:
+        if auth:
+            if self._base_headers_auth is None:
+                raise StayHereAuthError(401, "Missing API token for this request")
+            req_headers = self._base_headers_auth.copy()
+        else:
+            req_headers = self._base_headers_noauth.copy()
+        if not data:
+            del req_headers["Content-Type"]
+        if headers:
+            req_headers.update(headers)
+        return req_headers
+
+    def _parse_response(self, status: int, raw: bytes) -> Dict[str, Any]:
+        if not 200 <= status < 300:
+            payload = raw.decode("utf-8", errors="replace")
+            parsed = self._attempt_json(raw)
+            err_cls = StayHereAuthError if status in (401, 403) else StayHereHTTPError
+            raise err_cls(
+                status, parsed.get("error") or payload or f"HTTP {status}", payload=parsed
+            )
+        return self._safe_json(raw)
+
+    def _safe_json(self, raw: bytes) -> Dict[str, Any]:
+        if raw in _EMPTY_BODIES:
+            return {}
+        try:
+            return self._deserialize(raw)
+        except _DECODE_ERRORS:
+            raise StayHereWebhookInvokeError(
+                f"Server response was not valid {self.wire_format.upper()}",
+                payload=raw.decode("utf-8", errors="replace"),
+            )
+
+    def _attempt_json(self, raw: Union[str, bytes]) -> Dict[str, Any]:
+        if raw in _EMPTY_BODIES:
+            return {}
+        try:
+            return self._deserialize(raw)
+        except _DECODE_ERRORS:
+            return {}
+
+    def _normalize_permissions(self, perms: Optional[Sequence[str]]) -> List[str]:
+        if perms is None:
+            return list(DEFAULT_PERMISSIONS)
+        seen = set()
+        cleaned = []
+        for perm in perms:
+            if not perm:
+                continue
+            key = perm.strip().lower()
+            if key in _DEFAULT_PERMISSIONS_SET and key not in seen:
+                seen.add(key)
+                cleaned.append(key)
+        return cleaned or list(DEFAULT_PERMISSIONS)
+
+    def _build_url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        if path.startswith("/"):
+            return self._url_base + path
+        return self._url_base + "/" + path
+
+    @staticmethod
+    def _encode(value: Any) -> str:
+        # Coerce before hitting the cache: True, 1 and 1.0 hash equal but encode
+        # differently, and unhashable ids must still work.
+        return _quote_segment(str(value))
+
+    @staticmethod
+    def _normalize_api_prefix(prefix: str) -> str:
+        if not prefix:
+            return ""
+        trimmed = prefix.strip()
+        if not trimmed:
+            return ""
+        return "/" + trimmed.strip("/")
+
+
+class StayHereWebhookClient(_BaseWebhookClient):
+    """Manage StayHere webhooks and send payloads programmatically."""
+
+    __slots__ = (
+        "_pool",
+        "_proxies",
+        "_proxy_pools",
+        "_idle_connections",
+        "_connections_lock",
+    )
+
+    def __init__(
+        self,
+        base_url: str = "http://localhost:3000",
+        *,
+        token: Optional[str] = None,
+        api_prefix: str = "/api",
+        timeout: float = 10.0,
+        user_agent: str = "stayhere-webhooks/0.1",
+        default_alias: Optional[str] = None,
+        wire_format: Literal["json", "cbor"] = "json",
+        list_webhooks_ttl: float = 60.0,
+    ) -> None:
+        super().__init__(
+            base_url,
+            token=token,
+            api_prefix=api_prefix,
+            timeout=timeout,
+            user_agent=user_agent,
+            default_alias=default_alias,
+            wire_format=wire_format,
+            list_webhooks_ttl=list_webhooks_ttl,
+        )
+        self._pool = (
+            urllib3.PoolManager(num_pools=4, maxsize=16) if urllib3 is not None else None
+        )
+        # Honor HTTP(S)_PROXY / NO_PROXY the same way urllib.request does.
+        self._proxies = {
+            scheme: _normalize_proxy(proxy)
+            for scheme, proxy in getproxies().items()
+            if scheme in ("http", "https") and proxy
+        }
+        self._proxy_pools: Dict[str, Any] = {}
+        # Without urllib3, idle http.client connections are kept per (scheme, netloc).
+        self._idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+        self._connections_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Drop any pooled keep-alive connections."""
+
+        if self._pool is not None:
+            self._pool.clear()
+        for manager in list(self._proxy_pools.values()):
+            manager.clear()
+        with self._connections_lock:
+            idle = [conn for conns in self._idle_connections.values() for conn in conns]
+            self._idle_connections.clear()
+        for conn in idle:
+            conn.close()
+
+    def __enter__(self) -> "StayHereWebhookClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Public helpers
     # ------------------------------------------------------------------
     def list_webhooks(self, room_id: str) -> Dict[str, Any]:
-        """Return metadata + dataclass objects for every webhook in a room."""
+        """Return metadata + dataclass objects for every webhook in a room.
+
+        Results are cached per room for ``list_webhooks_ttl`` seconds.
+        """
 
+        cached = self._cached_hooks(room_id)
+        if cached is not None:
+            return cached
+        generation = self._hooks_generation(room_id)
         data = self._request("GET", f"/webhooks/{self._encode(room_id)}")
-        hooks = [Webhook.from_dict(item) for item in data.get("webhooks", [])]
-        return {
-            "room_id": data.get("roomId"),
-            "limit": data.get("limit"),
-            "webhooks": hooks,
-        }
+        hooks = [Webhook.from_dict(item) for item in data.get("webhooks") or ()]
+        return self._store_hooks(
+            room_id,
+            {
+                "room_id": data.get("roomId"),
+                "limit": data.get("limit"),
+                "webhooks": hooks,
+            },
+            generation,
+        )
 
     def create_webhook(
         self,
@@ -64,7 +688,10 @@ class StayHereWebhookClient:
             "label": label,
             "permissions": self._normalize_permissions(permissions),
         }
-        data = self._request("POST", f"/webhooks/{self._encode(room_id)}", body=payload)
+        try:
+            data = self._request("POST", f"/webhooks/{self._encode(room_id)}", body=payload)
+        finally:
+            self._invalidate_hooks(room_id)
         return WebhookSecretBundle.from_dict(data)
 
     def update_webhook(
@@ -83,25 +710,34 @@ class StayHereWebhookClient:
             payload["permissions"] = self._normalize_permissions(permissions)
         if paused is not None:
             payload["paused"] = bool(paused)
-        data = self._request(
-            "PATCH",
-            f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
-            body=payload or None,
-        )
+        try:
+            data = self._request(
+                "PATCH",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
+                body=payload or None,
+            )
+        finally:
+            self._invalidate_hooks(room_id)
         return Webhook.from_dict(data.get("webhook", data))
 
     def rotate_secret(self, room_id: str, webhook_id: str) -> WebhookSecretBundle:
-        data = self._request(
-            "POST",
-            f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}/rotate",
-        )
+        try:
+            data = self._request(
+                "POST",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}/rotate",
+            )
+        finally:
+            self._invalidate_hooks(room_id)
         return WebhookSecretBundle.from_dict(data)
 
     def delete_webhook(self, room_id: str, webhook_id: str) -> bool:
-        data = self._request(
-            "DELETE",
-            f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
-        )
+        try:
+            data = self._request(
+                "DELETE",
+                f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}",
+            )
+        finally:
+            self._invalidate_hooks(room_id)
         return bool(data.get("ok", True))
 
     def get_permitted_actions(self, room_id: str) -> PermittedActions:
@@ -124,21 +760,12 @@ class StayHereWebhookClient:
         webhook_id: Optional[str] = None,
         invoke_url: Optional[str] = None,
     ) -> InvokeResult:
-        if not invoke_url:
-            if not room_id or not webhook_id:
-                raise StayHereValidationError(
-                    "room_id and webhook_id are required when invoke_url is missing"
-                )
-            path = f"/webhooks/{self._encode(room_id)}/{self._encode(webhook_id)}/invoke"
-            full_url = self._build_url(path)
-        else:
-            full_url = invoke_url
-        body = {"action": action, "payload": payload}
+        full_url = self._invoke_url(room_id, webhook_id, invoke_url)
         headers = {WEBHOOK_SECRET_HEADER: secret}
         data = self._request(
             "POST",
             full_url=full_url,
-            body=body,
+            raw_body=self._invoke_body(action, payload),
             headers=headers,
             auth=False,
         )
@@ -154,23 +781,56 @@ class StayHereWebhookClient:
         alias: Optional[str] = None,
         extra: Optional[Dict[str, Any]] = None,
     ) -> InvokeResult:
-        text_value = (text or "").strip()
-        if not text_value:
-            raise StayHereValidationError("Message text must be provided")
-        payload: Dict[str, Any] = {"text": text_value}
-        alias_value = alias or self.default_alias
-        if alias_value:
-            payload["alias"] = alias_value
-        if extra:
-            payload.update(extra)
         return self.invoke_webhook(
             room_id=room_id,
             webhook_id=webhook_id,
             secret=secret,
             action="message",
-            payload=payload,
+            payload=self._message_payload(text, alias, extra),
         )
 
+    def send_message_fast(
+        self,
+        room_id: str,
+        webhook_id: str,
+        *,
+        secret: str,
+        text: str,
+    ) -> InvokeResult:
+        """Send a plain message using the client's ``default_alias``.
+
+        The request body is assembled from a pre-serialized envelope, so only
+        ``text`` is encoded per call. Use :meth:`send_message` for per-call
+        aliases or extra payload fields.
+        """
+
+        data = self._request(
+            "POST",
+            full_url=self._invoke_url(room_id, webhook_id, None),
+            raw_body=self._message_body(text),
+            headers={WEBHOOK_SECRET_HEADER: secret},
+            auth=False,
+        )
+        return InvokeResult.from_dict(data)
+
+    def send_messages_bulk(
+        self,
+        items: Sequence[Dict[str, Any]],
+        *,
+        max_workers: int = 16,
+    ) -> List[InvokeResult]:
+        """Send many messages concurrently over the shared connection pool.
+
+        Each item holds the keyword arguments for :meth:`send_message`. Results
+        come back in the same order as ``items``; the first failure is re-raised.
+        """
+
+        if not items:
+            return []
+        workers = max(1, min(max_workers, len(items)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(lambda item: self.send_message(**item), items))
+
     def send_embed(
         self,
         room_id: str,
@@ -188,37 +848,18 @@ class StayHereWebhookClient:
         notes: Optional[Iterable[str]] = None,
         extra_embed_fields: Optional[Dict[str, Any]] = None,
     ) -> InvokeResult:
-        embed: Dict[str, Any] = {}
-        if title:
-            embed["title"] = title
-        if description:
-            embed["description"] = description
-        if color:
-            embed["color"] = color
-        if url:
-            embed["url"] = url
-        if image:
-            embed["image"] = image
-        if footer:
-            embed["footer"] = footer
-        if notes:
-            extra_lines = [note.strip() for note in notes if note and note.strip()]
-            if extra_lines:
-                current_desc = embed.get("description", "").strip()
-                bullet_block = "\n".join(f"• {line}" for line in extra_lines)
-                embed["description"] = (
-                    f"{current_desc}\n\n{bullet_block}" if current_desc else bullet_block
-                )
-        if extra_embed_fields:
-            embed.update(extra_embed_fields)
-        if not embed:
-            raise StayHereValidationError("Embed payload must include at least one field")
-        payload: Dict[str, Any] = {"embed": embed}
-        if text:
-            payload["text"] = text
-        alias_value = alias or self.default_alias
-        if alias_value:
-            payload["alias"] = alias_value
+        payload = self._embed_payload(
+            title=title,
+            description=description,
+            color=color,
+            url=url,
+            image=image,
+            footer=footer,
+            text=text,
+            alias=alias,
+            notes=notes,
+            extra_embed_fields=extra_embed_fields,
+        )
         return self.invoke_webhook(
             room_id=room_id,
             webhook_id=webhook_id,
@@ -238,25 +879,12 @@ class StayHereWebhookClient:
         multiple_choice: bool = False,
         ends_in_minutes: Optional[int] = None,
     ) -> InvokeResult:
-        clean_opts = [opt.strip() for opt in options if opt and opt.strip()]
-        if len(clean_opts) < 2:
-            raise StayHereValidationError("A poll must include at least two options")
-        question_value = (question or "").strip()
-        if not question_value:
-            raise StayHereValidationError("Poll question cannot be empty")
-        payload: Dict[str, Any] = {
-            "question": question_value,
-            "options": clean_opts[:8],
-            "multipleChoice": bool(multiple_choice),
-        }
-        if ends_in_minutes:
-            payload["endsInMinutes"] = int(ends_in_minutes)
         return self.invoke_webhook(
             room_id=room_id,
             webhook_id=webhook_id,
             secret=secret,
             action="poll",
-            payload=payload,
+            payload=self._poll_payload(question, options, multiple_choice, ends_in_minutes),
         )
 
     def send_image(
@@ -269,20 +897,12 @@ class StayHereWebhookClient:
         size: Optional[Tuple[int, int]] = None,
         position: Optional[Tuple[int, int]] = None,
     ) -> InvokeResult:
-        img_url = (url or "").strip()
-        if not img_url.startswith("http"):
-            raise StayHereValidationError("Image URL must be an http/https URL")
-        payload: Dict[str, Any] = {"url": img_url}
-        if size:
-            payload["w"], payload["h"] = map(int, size)
-        if position:
-            payload["x"], payload["y"] = map(int, position)
         return self.invoke_webhook(
             room_id=room_id,
             webhook_id=webhook_id,
             secret=secret,
             action="image",
-            payload=payload,
+            payload=self._image_payload(url, size, position),
         )
 
     # ------------------------------------------------------------------
@@ -295,82 +915,178 @@ class StayHereWebhookClient:
         *,
         full_url: Optional[str] = None,
         body: Optional[Dict[str, Any]] = None,
+        raw_body: Optional[bytes] = None,
         headers: Optional[Dict[str, str]] = None,
         auth: bool = True,
     ) -> Dict[str, Any]:
         url = full_url or self._build_url(path or "/")
-        data = json.dumps(body, separators=(",", ":")).encode("utf-8") if body else None
-        req_headers = {
-            "Accept": "application/json",
-            "User-Agent": self.user_agent,
-        }
-        if data:
-            req_headers["Content-Type"] = "application/json"
-        if auth:
-            if not self.token:
-                raise StayHereAuthError(401, "Missing API token for this request")
-            req_headers["Authorization"] = f"Bearer {self.token}"
-        if headers:
-            req_headers.update(headers)
-        req = request.Request(url, data=data, headers=req_headers, method=method.upper())
+        if raw_body is not None:
+            data: Optional[bytes] = raw_body
+        else:
+            data = self._serialize(body) if body else None
+        req_headers = self._request_headers(data, headers, auth)
+        if self._pool is not None:
+            status, raw = self._send_pooled(method.upper(), url, data, req_headers)
+        else:
+            status, raw = self._send_http_client(method.upper(), url, data, req_headers)
+        return self._parse_response(status, raw)
+
+    def _send_pooled(
+        self, method: str, url: str, data: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, bytes]:
+        # Never re-send a body (or the webhook secret) to a redirect target; only
+        # safe methods follow 3xx responses, the rest surface them as HTTP errors.
+        if method in ("GET", "HEAD"):
+            redirect_kwargs: Dict[str, Any] = {"retries": _SAFE_METHOD_RETRIES}
+        else:
+            redirect_kwargs = {"redirect": False}
         try:
-            with request.urlopen(req, timeout=self.timeout) as resp:
-                raw = resp.read().decode("utf-8")
-        except error.HTTPError as exc:
-            payload = exc.read().decode("utf-8", errors="replace")
-            parsed = self._attempt_json(payload)
-            err_cls = StayHereAuthError if exc.code in (401, 403) else StayHereHTTPError
-            raise err_cls(exc.code, parsed.get("error") or payload or str(exc), payload=parsed)
-        except error.URLError as exc:
+            resp = self._pool_for(url).request(
+                method, url, body=data, headers=headers, timeout=self.timeout, **redirect_kwargs
+            )
+        except urllib3.exceptions.MaxRetryError as exc:
             raise StayHereError(f"Failed to reach StayHere server: {exc.reason}")
+        except urllib3.exceptions.HTTPError as exc:
+            raise StayHereError(f"Failed to reach StayHere server: {exc}")
         except Exception as exc:  # pragma: no cover - defensive logging
             raise StayHereError(str(exc))
-        return self._safe_json(raw)
+        return resp.status, resp.data
 
-    def _safe_json(self, raw: str) -> Dict[str, Any]:
-        if not raw:
-            return {}
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            raise StayHereWebhookInvokeError("Server response was not valid JSON", payload=raw)
+    def _proxy_for(self, scheme: str, netloc: str) -> Optional[str]:
+        proxy = self._proxies.get(scheme)
+        if proxy is None or proxy_bypass(netloc):
+            return None
+        return proxy
 
-    def _attempt_json(self, raw: str) -> Dict[str, Any]:
-        if not raw:
-            return {}
-        try:
-            return json.loads(raw)
-        except json.JSONDecodeError:
-            return {}
+    def _pool_for(self, url: str) -> Any:
+        parts = urlsplit(url)
+        proxy = self._proxy_for(parts.scheme, parts.netloc)
+        if proxy is None:
+            return self._pool
+        manager = self._proxy_pools.get(proxy)
+        if manager is None:
+            manager = self._proxy_pools.setdefault(
+                proxy,
+                urllib3.ProxyManager(
+                    proxy, num_pools=4, maxsize=16, proxy_headers=_proxy_headers(proxy)
+                ),
+            )
+        return manager
 
-    def _normalize_permissions(self, perms: Optional[Sequence[str]]) -> List[str]:
-        if perms is None:
-            return list(DEFAULT_PERMISSIONS)
-        cleaned = []
-        for perm in perms:
-            if not perm:
-                continue
-            key = perm.strip().lower()
-            if key in DEFAULT_PERMISSIONS and key not in cleaned:
-                cleaned.append(key)
-        return cleaned or list(DEFAULT_PERMISSIONS)
+    def _send_http_client(
+        self, method: str, url: str, data: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, bytes]:
+        for _ in range(_MAX_REDIRECTS + 1):
+            status, raw, location = self._http_client_roundtrip(method, url, data, headers)
+            # Only safe methods follow redirects (as in _send_pooled); anything else
+            # surfaces the 3xx as an HTTP error instead of being re-sent elsewhere.
+            if status not in _REDIRECT_STATUSES or not location or method not in ("GET", "HEAD"):
+                return status, raw
+            next_url = urljoin(url, location)
+            if urlsplit(next_url)[:2] != urlsplit(url)[:2]:
+                headers = {
+                    k: v for k, v in headers.items() if k.lower() not in _REDIRECT_STRIP_HEADERS
+                }
+            url = next_url
+        raise StayHereError(f"Too many redirects (more than {_MAX_REDIRECTS})")
 
-    def _build_url(self, path: str) -> str:
-        if path.startswith("http://") or path.startswith("https://"):
-            return path
-        if not path.startswith("/"):
-            path = "/" + path
-        prefix = self.api_prefix
-        return f"{self.base_url}{prefix}{path}"
+    def _http_client_roundtrip(
+        self, method: str, url: str, data: Optional[bytes], headers: Dict[str, str]
+    ) -> Tuple[int, bytes, Optional[str]]:
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        host, port = parts.hostname or "", parts.port
+        proxy = self._proxy_for(parts.scheme, parts.netloc)
+        if proxy is not None and parts.scheme == "http":
+            # Plain HTTP goes to the proxy with an absolute-form request target.
+            target = parts._replace(fragment="").geturl()
+            headers = {**headers, **_proxy_headers(proxy)}
+        else:
+            target = parts.path or "/"
+            if parts.query:
+                target = f"{target}?{parts.query}"
+        conn, reused = self._checkout_connection(key, host, port, proxy)
+        while True:
+            try:
+                conn.request(method, target, body=data, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+                break
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError) as exc:
+                conn.close()
+                if not (reused and method in _IDEMPOTENT_METHODS):
+                    raise StayHereError(f"Failed to reach StayHere server: {exc}")
+                # The keep-alive connection died under us; a safe method can go again.
+                conn, reused = self._new_connection(parts.scheme, host, port, proxy), False
+            except (OSError, http.client.HTTPException) as exc:
+                conn.close()
+                raise StayHereError(f"Failed to reach StayHere server: {exc}")
+            except Exception as exc:  # pragma: no cover - defensive logging
+                conn.close()
+                raise StayHereError(str(exc))
+        if resp.will_close:
+            conn.close()
+        else:
+            self._checkin_connection(key, conn)
+        return resp.status, raw, resp.getheader("Location")
 
-    def _encode(self, value: str) -> str:
-        return parse.quote(str(value), safe="")
+    def _checkout_connection(
+        self, key: Tuple[str, str], host: str, port: Optional[int], proxy: Optional[str]
+    ) -> Tuple[http.client.HTTPConnection, bool]:
+        while True:
+            with self._connections_lock:
+                idle = self._idle_connections.get(key)
+                conn = idle.pop() if idle else None
+            if conn is None:
+                return self._new_connection(key[0], host, port, proxy), False
+            if self._connection_dropped(conn):
+                conn.close()
+                continue
+            conn.timeout = self.timeout
+            conn.sock.settimeout(self.timeout)
+            return conn, True
 
     @staticmethod
-    def _normalize_api_prefix(prefix: str) -> str:
-        if not prefix:
-            return ""
-        trimmed = prefix.strip()
-        if not trimmed:
-            return ""
-        return "/" + trimmed.strip("/")
+    def _connection_dropped(conn: http.client.HTTPConnection) -> bool:
+        # An idle keep-alive socket should have nothing to read; readable means the
+        # server closed it (EOF) or sent something unexpected, so don't reuse it.
+        sock = conn.sock
+        if sock is None:
+            return True
+        try:
+            if _HAS_POLL:
+                # poll() has no FD_SETSIZE limit, unlike select() on descriptors >= 1024.
+                poller = select.poll()
+                poller.register(sock, select.POLLIN)
+                return bool(poller.poll(0))
+            readable, _, _ = select.select([sock], [], [], 0)
+        except (OSError, ValueError):
+            return True
+        return bool(readable)
+
+    def _checkin_connection(self, key: Tuple[str, str], conn: http.client.HTTPConnection) -> None:
+        with self._connections_lock:
+            idle = self._idle_connections.setdefault(key, [])
+            if len(idle) < _MAX_IDLE_CONNECTIONS:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def _new_connection(
+        self, scheme: str, host: str, port: Optional[int], proxy: Optional[str] = None
+    ) -> http.client.HTTPConnection:
+        if scheme not in ("http", "https"):
+            raise StayHereValidationError(f"Unsupported URL scheme: {scheme!r}")
+        if proxy is None:
+            if scheme == "https":
+                return http.client.HTTPSConnection(host, port, timeout=self.timeout)
+            return http.client.HTTPConnection(host, port, timeout=self.timeout)
+        proxy_parts = urlsplit(proxy)
+        proxy_host = proxy_parts.hostname or ""
+        proxy_port = proxy_parts.port or (443 if proxy_parts.scheme == "https" else 80)
+        if scheme == "https":
+            # TLS to the target runs inside a CONNECT tunnel through the proxy.
+            conn = http.client.HTTPSConnection(proxy_host, proxy_port, timeout=self.timeout)
+            conn.set_tunnel(host, port, headers=_proxy_headers(proxy))
+            return conn
+        return http.client.HTTPConnection(proxy_host, proxy_port, timeout=self.timeout)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+_INVOKE_KNOWN_KEYS = frozenset({"ok", "kind", "messageId", "pollId"})
+
 
 @dataclass
 class Webhook:
@@ -21,17 +23,18 @@ class Webhook:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Webhook":
+        get = data.get
         return cls(
-            id=data.get("id", ""),
-            label=data.get("label", ""),
-            permissions=list(data.get("permissions") or []),
-            paused=bool(data.get("paused", False)),
-            created_at=data.get("createdAt"),
-            created_by=data.get("createdBy"),
-            last_used_at=data.get("lastUsedAt"),
-            secret_preview=data.get("secretPreview"),
-            invoke_url=data.get("invokeUrl"),
-            example_curl=data.get("exampleCurl"),
+            id=get("id", ""),
+            label=get("label", ""),
+            permissions=list(get("permissions") or ()),
+            paused=bool(get("paused", False)),
+            created_at=get("createdAt"),
+            created_by=get("createdBy"),
+            last_used_at=get("lastUsedAt"),
+            secret_preview=get("secretPreview"),
+            invoke_url=get("invokeUrl"),
+            example_curl=get("exampleCurl"),
         )
 
 
@@ -44,11 +47,12 @@ class WebhookSecretBundle:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "WebhookSecretBundle":
+        hook = data.get("webhook", {})
         return cls(
-            webhook=Webhook.from_dict(data.get("webhook", {})),
+            webhook=Webhook.from_dict(hook),
             secret=data.get("secret", ""),
-            invoke_url=data.get("invokeUrl") or data.get("webhook", {}).get("invokeUrl"),
-            example_curl=data.get("exampleCurl") or data.get("webhook", {}).get("exampleCurl"),
+            invoke_url=data.get("invokeUrl") or hook.get("invokeUrl"),
+            example_curl=data.get("exampleCurl") or hook.get("exampleCurl"),
         )
 
 
@@ -67,7 +71,7 @@ class InvokeResult:
             kind=data.get("kind"),
             message_id=data.get("messageId"),
             poll_id=data.get("pollId"),
-            extra={k: v for k, v in data.items() if k not in {"ok", "kind", "messageId", "pollId"}},
+            extra={k: v for k, v in data.items() if k not in _INVOKE_KNOWN_KEYS},
         )
 
 
@@ -0,0 +1,41 @@
+"""Tests for path-segment percent-encoding in stayhooks.client."""
+
+from __future__ import annotations
+
+import random
+import unittest
+from urllib.parse import quote
+
+from stayhooks import StayHereWebhookClient
+from stayhooks import client as client_module
+
+
+class EncodeTests(unittest.TestCase):
+    def test_equal_hashing_values_encode_independently(self):
+        encode = StayHereWebhookClient._encode
+        self.assertEqual(encode(1), "1")
+        self.assertEqual(encode(True), "True")
+        self.assertEqual(encode(1.0), "1.0")
+        self.assertEqual(encode(1), "1")
+
+    def test_unhashable_values_are_encoded(self):
+        self.assertEqual(StayHereWebhookClient._encode(["a b"]), "%5B%27a%20b%27%5D")
+
+    def test_reserved_and_non_ascii_characters(self):
+        self.assertEqual(StayHereWebhookClient._encode("room/1 ä"), "room%2F1%20%C3%A4")
+
+    def test_quote_table_matches_urllib_quote(self):
+        for byte in range(256):
+            self.assertEqual(client_module._QUOTE_TABLE[byte], quote(bytes([byte]), safe=""))
+
+    def test_matches_urllib_quote_for_random_strings(self):
+        rng = random.Random(1234)
+        alphabet = [chr(c) for c in range(0x250)] + ["\U0001F600", "/", "%", "?", "#"]
+        for _ in range(2000):
+            value = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+            with self.subTest(value=value):
+                self.assertEqual(StayHereWebhookClient._encode(value), quote(value, safe=""))
+
+
+if __name__ == "__main__":
+    unittest.main()
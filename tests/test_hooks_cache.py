@@ -0,0 +1,177 @@
+"""Tests for the list_webhooks TTL cache shared by both clients."""
+
+from __future__ import annotations
+
+import asyncio
+import unittest
+from unittest import mock
+
+from stayhooks import StayHereError, StayHereWebhookClient
+from stayhooks import client as client_module
+from stayhooks.async_client import aiohttp
+
+LIST_RESPONSE = {"roomId": "r1", "limit": 5, "webhooks": [{"id": "w1", "label": "Deploy"}]}
+
+MUTATIONS = {
+    "create_webhook": lambda c: c.create_webhook("r1", label="New"),
+    "update_webhook": lambda c: c.update_webhook("r1", "w1", label="Renamed"),
+    "rotate_secret": lambda c: c.rotate_secret("r1", "w1"),
+    "delete_webhook": lambda c: c.delete_webhook("r1", "w1"),
+}
+
+
+class _FakeServer:
+    """Stands in for ``_request`` and records every call."""
+
+    def __init__(self):
+        self.calls = []
+        self.fail = False
+        self.during_get = None
+
+    def __call__(self, method, path=None, **kwargs):
+        self.calls.append((method, path))
+        if self.during_get is not None and method == "GET":
+            self.during_get()
+        if self.fail:
+            raise StayHereError("boom")
+        return dict(LIST_RESPONSE) if method == "GET" else {"ok": True}
+
+    def gets(self):
+        return sum(1 for method, _ in self.calls if method == "GET")
+
+
+class HooksCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.server = _FakeServer()
+        patcher = mock.patch.object(StayHereWebhookClient, "_request", side_effect=self.server)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = self.make_client()
+
+    def make_client(self, **kwargs):
+        client = StayHereWebhookClient("http://example.test", token="t", **kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def test_second_call_is_served_from_cache(self):
+        first = self.client.list_webhooks("r1")
+        second = self.client.list_webhooks("r1")
+        self.assertEqual(self.server.gets(), 1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first["webhooks"][0], second["webhooks"][0])
+
+    def test_entries_expire_after_ttl(self):
+        clock = mock.Mock()
+        clock.monotonic.return_value = 100.0
+        with mock.patch.object(client_module, "time", clock):
+            client = self.make_client(list_webhooks_ttl=5)
+            client.list_webhooks("r1")
+            clock.monotonic.return_value = 104.9
+            client.list_webhooks("r1")
+            self.assertEqual(self.server.gets(), 1)
+            clock.monotonic.return_value = 105.0
+            client.list_webhooks("r1")
+            self.assertEqual(self.server.gets(), 2)
+
+    def test_zero_ttl_disables_caching(self):
+        client = self.make_client(list_webhooks_ttl=0)
+        client.list_webhooks("r1")
+        client.list_webhooks("r1")
+        self.assertEqual(self.server.gets(), 2)
+        self.assertEqual(client._hooks_cache, {})
+
+    def test_mutations_invalidate_the_room(self):
+        for name, mutate in MUTATIONS.items():
+            for fail in (False, True):
+                with self.subTest(mutation=name, fail=fail):
+                    self.server.fail = False
+                    self.client.list_webhooks("r1")
+                    self.client.list_webhooks("r2")
+                    gets = self.server.gets()
+                    self.server.fail = fail
+                    if fail:
+                        with self.assertRaises(StayHereError):
+                            mutate(self.client)
+                    else:
+                        mutate(self.client)
+                    self.server.fail = False
+                    self.client.list_webhooks("r1")
+                    self.client.list_webhooks("r2")
+                    self.assertEqual(self.server.gets(), gets + 1)
+
+    def test_credential_and_server_changes_clear_the_cache(self):
+        changes = {
+            "token": lambda c: setattr(c, "token", "other"),
+            "base_url": lambda c: setattr(c, "base_url", "http://other.test"),
+            "api_prefix": lambda c: setattr(c, "api_prefix", "/v2"),
+        }
+        for name, change in changes.items():
+            with self.subTest(change=name):
+                self.client.list_webhooks("r1")
+                gets = self.server.gets()
+                change(self.client)
+                self.client.list_webhooks("r1")
+                self.assertEqual(self.server.gets(), gets + 1)
+
+    def test_fetch_racing_an_invalidation_is_not_stored(self):
+        self.server.during_get = lambda: self.client._invalidate_hooks("r1")
+        self.client.list_webhooks("r1")
+        self.server.during_get = None
+        self.client.list_webhooks("r1")
+        self.assertEqual(self.server.gets(), 2)
+
+    def test_fetch_racing_a_cache_clear_is_not_stored(self):
+        self.server.during_get = lambda: setattr(self.client, "token", "other")
+        self.client.list_webhooks("r1")
+        self.server.during_get = None
+        self.client.list_webhooks("r1")
+        self.assertEqual(self.server.gets(), 2)
+
+    def test_generation_counters_stay_bounded(self):
+        for index in range(client_module._HOOKS_CACHE_SIZE * 2):
+            self.client._invalidate_hooks(f"room-{index}")
+        self.assertLessEqual(len(self.client._hooks_generations), client_module._HOOKS_CACHE_SIZE)
+
+
+@unittest.skipIf(aiohttp is None, "aiohttp is not installed")
+class AsyncHooksCacheTests(unittest.TestCase):
+    def setUp(self):
+        from stayhooks import AsyncStayHereWebhookClient
+
+        self.server = _FakeServer()
+        patcher = mock.patch.object(
+            AsyncStayHereWebhookClient, "_request", new=mock.AsyncMock(side_effect=self.server)
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = AsyncStayHereWebhookClient("http://example.test", token="t")
+
+    def run_async(self, coro):
+        return asyncio.run(coro)
+
+    def test_failed_mutation_invalidates_the_room(self):
+        async def scenario():
+            await self.client.list_webhooks("r1")
+            self.server.fail = True
+            with self.assertRaises(StayHereError):
+                await self.client.delete_webhook("r1", "w1")
+            self.server.fail = False
+            await self.client.list_webhooks("r1")
+
+        self.run_async(scenario())
+        self.assertEqual(self.server.gets(), 2)
+
+    def test_fetch_racing_an_invalidation_is_not_stored(self):
+        async def scenario():
+            self.server.during_get = lambda: self.client._invalidate_hooks("r1")
+            await self.client.list_webhooks("r1")
+            self.server.during_get = None
+            await self.client.list_webhooks("r1")
+            await self.client.list_webhooks("r1")
+
+        self.run_async(scenario())
+        self.assertEqual(self.server.gets(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,162 @@
+"""Tests for the dependency-free http.client transport of StayHereWebhookClient."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import os
+import socket
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from stayhooks import StayHereError, StayHereHTTPError, StayHereWebhookClient
+from stayhooks import client as client_module
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # keep test output quiet
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if length:
+            self.rfile.read(length)
+        self.requests_on_connection = getattr(self, "requests_on_connection", 0) + 1
+        server = self.server
+        server.requests.append((self.command, self.path, self.client_address))
+
+        if server.mode == "drop_second" and self.requests_on_connection == 2:
+            # Request received, then the connection dies without a response.
+            self.close_connection = True
+            return
+        if self.path.endswith("/redirect"):
+            self._reply(302, b"", location="/api/webhooks/r1")
+            return
+        if self.path.endswith("/invoke") and server.mode == "redirect_invoke":
+            self._reply(302, b"", location="/elsewhere")
+            return
+        if self.command == "GET":
+            body = {"roomId": "r1", "limit": 5, "webhooks": [{"id": "w1", "label": "Deploy"}]}
+        else:
+            body = {"ok": True, "kind": "message", "messageId": "m1"}
+        self._reply(200, json.dumps(body).encode("utf-8"))
+        if server.mode == "close_after_response":
+            # Close the keep-alive connection without announcing "Connection: close".
+            self.close_connection = True
+
+    def _reply(self, status, body, location=None):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+
+class HttpClientTransportTests(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        self.server.daemon_threads = True
+        self.server.requests = []
+        self.server.mode = "normal"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        # Force the stdlib transport and ignore any proxy settings of the host.
+        patches = [
+            mock.patch.object(client_module, "urllib3", None),
+            mock.patch.object(client_module, "getproxies", return_value={}),
+        ]
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        base_url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        self.client = StayHereWebhookClient(base_url, token="t", list_webhooks_ttl=0)
+        self.addCleanup(self.client.close)
+
+    def _send(self):
+        return self.client.send_message("r1", "w1", secret="s", text="hello")
+
+    def test_reuses_keep_alive_connection(self):
+        for _ in range(3):
+            self.assertTrue(self._send().ok)
+        ports = {address for _, _, address in self.server.requests}
+        self.assertEqual(len(ports), 1)
+
+    def test_idle_connection_closed_by_server_is_not_reused(self):
+        self.server.mode = "close_after_response"
+        self.assertTrue(self._send().ok)
+        time.sleep(0.05)
+        self.assertTrue(self._send().ok)
+        self.assertEqual([method for method, _, _ in self.server.requests], ["POST", "POST"])
+
+    def test_post_is_not_resent_after_connection_dies_mid_request(self):
+        self.server.mode = "drop_second"
+        self._send()
+        with self.assertRaises(StayHereError):
+            self._send()
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_get_is_retried_after_connection_dies_mid_request(self):
+        self.server.mode = "drop_second"
+        self.client.list_webhooks("r1")
+        result = self.client.list_webhooks("r1")
+        self.assertEqual([hook.id for hook in result["webhooks"]], ["w1"])
+        self.assertEqual(len(self.server.requests), 3)
+
+    def test_get_follows_redirects(self):
+        data = self.client._request("GET", "/webhooks/redirect")
+        self.assertEqual(data["roomId"], "r1")
+        self.assertEqual(
+            [path for _, path, _ in self.server.requests],
+            ["/api/webhooks/redirect", "/api/webhooks/r1"],
+        )
+
+    def test_post_redirect_raises_http_error(self):
+        self.server.mode = "redirect_invoke"
+        with self.assertRaises(StayHereHTTPError) as ctx:
+            self._send()
+        self.assertEqual(ctx.exception.status, 302)
+        self.assertEqual(len(self.server.requests), 1)
+
+    def test_timeout_change_applies_to_idle_connections(self):
+        self._send()
+        self.client.timeout = 3.5
+        self._send()
+        (conn,) = [conn for conns in self.client._idle_connections.values() for conn in conns]
+        self.assertEqual(conn.timeout, 3.5)
+        self.assertEqual(conn.sock.gettimeout(), 3.5)
+
+    def test_liveness_check_handles_high_file_descriptors(self):
+        # select() rejects descriptors >= FD_SETSIZE (1024), which used to make every
+        # idle connection look dead once a process had many files open.
+        try:
+            import resource
+        except ImportError:  # pragma: no cover - Windows
+            self.skipTest("resource module not available")
+        if resource.getrlimit(resource.RLIMIT_NOFILE)[0] <= 1100:
+            self.skipTest("file descriptor limit too low")
+        local, remote = socket.socketpair()
+        self.addCleanup(remote.close)
+        high_fd = os.dup2(local.fileno(), 1100)
+        local.close()
+        conn = http.client.HTTPConnection("127.0.0.1")
+        conn.sock = socket.socket(fileno=high_fd)
+        self.addCleanup(conn.close)
+
+        self.assertFalse(StayHereWebhookClient._connection_dropped(conn))
+        remote.close()
+        self.assertTrue(StayHereWebhookClient._connection_dropped(conn))
+
+
+if __name__ == "__main__":
+    unittest.main()
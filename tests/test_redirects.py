@@ -0,0 +1,120 @@
+"""Redirect handling of StayHereWebhookClient, for both HTTP transports."""
+
+from __future__ import annotations
+
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from stayhooks import StayHereHTTPError, StayHereWebhookClient
+from stayhooks import client as client_module
+from stayhooks.client import WEBHOOK_SECRET_HEADER
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):  # keep test output quiet
+        pass
+
+    def _handle(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        server = self.server
+        server.requests.append((self.command, self.path, dict(self.headers), body))
+        if server.redirect_to is not None and self.path != "/final":
+            self._reply(server.redirect_status, b"", location=server.redirect_to)
+            return
+        self._reply(200, json.dumps({"ok": True, "roomId": "r1"}).encode("utf-8"))
+
+    def _reply(self, status, body, location=None):
+        self.send_response(status)
+        if location:
+            self.send_header("Location", location)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _handle
+
+
+class _RedirectTests:
+    use_urllib3 = False
+
+    def _start_server(self):
+        server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+        server.daemon_threads = True
+        server.requests = []
+        server.redirect_to = None
+        server.redirect_status = 307
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+    def setUp(self):
+        self.server, self.base_url = self._start_server()
+        patches = [mock.patch.object(client_module, "getproxies", return_value={})]
+        if not self.use_urllib3:
+            patches.append(mock.patch.object(client_module, "urllib3", None))
+        for patcher in patches:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.client = StayHereWebhookClient(self.base_url, token="t", list_webhooks_ttl=0)
+        self.addCleanup(self.client.close)
+        self.assertEqual(self.client._pool is not None, self.use_urllib3)
+
+    def test_post_redirect_is_not_followed(self):
+        for status in (301, 302, 303, 307, 308):
+            with self.subTest(status=status):
+                self.server.requests.clear()
+                self.server.redirect_status = status
+                self.server.redirect_to = "/final"
+                with self.assertRaises(StayHereHTTPError) as ctx:
+                    self.client.send_message("r1", "w1", secret="s", text="hello")
+                self.assertEqual(ctx.exception.status, status)
+                self.assertEqual(len(self.server.requests), 1)
+
+    def test_delete_redirect_is_not_followed(self):
+        self.server.redirect_to = "/final"
+        with self.assertRaises(StayHereHTTPError):
+            self.client.delete_webhook("r1", "w1")
+        self.assertEqual([method for method, *_ in self.server.requests], ["DELETE"])
+
+    def test_get_follows_same_origin_redirect(self):
+        self.server.redirect_to = "/final"
+        self.assertEqual(self.client._request("GET", "/webhooks/r1")["roomId"], "r1")
+        self.assertEqual(
+            [path for _, path, _, _ in self.server.requests], ["/api/webhooks/r1", "/final"]
+        )
+
+    def test_get_redirect_to_other_origin_drops_credentials(self):
+        other, other_url = self._start_server()
+        self.server.redirect_to = f"{other_url}/final"
+        self.client._request(
+            "GET", "/webhooks/r1", headers={WEBHOOK_SECRET_HEADER: "s"}
+        )
+        first_headers = {k.lower() for k in self.server.requests[0][2]}
+        self.assertIn("authorization", first_headers)
+        self.assertIn(WEBHOOK_SECRET_HEADER, first_headers)
+        ((_, path, headers, _),) = other.requests
+        self.assertEqual(path, "/final")
+        received = {k.lower() for k in headers}
+        self.assertNotIn("authorization", received)
+        self.assertNotIn(WEBHOOK_SECRET_HEADER, received)
+
+
+class HttpClientRedirectTests(_RedirectTests, unittest.TestCase):
+    use_urllib3 = False
+
+
+@unittest.skipIf(client_module.urllib3 is None, "urllib3 is not installed")
+class Urllib3RedirectTests(_RedirectTests, unittest.TestCase):
+    use_urllib3 = True
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,148 @@
+"""Tests for request-body serialization in stayhooks.client."""
+
+from __future__ import annotations
+
+import json
+import unittest
+from unittest import mock
+
+from stayhooks import StayHereWebhookClient
+from stayhooks import client as client_module
+
+PAYLOADS = [
+    {"text": "hello"},
+    {1: "x", "text": "int key"},
+    {True: 1, None: 2, 2.5: "float key"},
+    {"big": 2**70},
+    {"nested": {"list": [1, "two", None, {"é": "ü"}]}},
+]
+
+
+class DumpsTests(unittest.TestCase):
+    def test_dumps_matches_stdlib_json(self):
+        for payload in PAYLOADS:
+            with self.subTest(payload=payload):
+                expected = json.loads(client_module._json_dumps(payload))
+                self.assertEqual(json.loads(client_module._dumps(payload)), expected)
+
+    def test_dumps_returns_bytes(self):
+        self.assertIsInstance(client_module._dumps({"a": 1}), bytes)
+
+
+# Strings that need escaping or are outside ASCII, to exercise the hand-built envelopes.
+TRICKY_STRINGS = [
+    'say "hi"',
+    "back\\slash",
+    "line\nbreak",
+    "caf\u00e9 \u2713 \U0001F600",
+    "</script>",
+]
+
+
+class _BodyTests:
+    """Runs each test with orjson (when installed) and with the stdlib json fallback."""
+
+    use_stdlib = False
+
+    def setUp(self):
+        if self.use_stdlib:
+            patcher = mock.patch.object(client_module, "_dumps", client_module._json_dumps)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        elif client_module.orjson is None:
+            self.skipTest("orjson is not installed")
+
+    def make_client(self, **kwargs):
+        client = StayHereWebhookClient(**kwargs)
+        self.addCleanup(client.close)
+        return client
+
+    def generic_body(self, client, action, payload):
+        return json.loads(client._serialize({"action": action, "payload": payload}))
+
+
+class _InvokeBodyTests(_BodyTests):
+    def test_matches_generic_envelope(self):
+        client = self.make_client()
+        actions = list(client_module.DEFAULT_PERMISSIONS) + ["custom"]
+        for action in actions:
+            for value in TRICKY_STRINGS:
+                payload = {"text": value, value: [1, None, {"nested": value}]}
+                with self.subTest(action=action, value=value):
+                    body = client._invoke_body(action, payload)
+                    self.assertIsInstance(body, bytes)
+                    self.assertEqual(
+                        json.loads(body), self.generic_body(client, action, payload)
+                    )
+                    self.assertEqual(json.loads(body), {"action": action, "payload": payload})
+
+
+class InvokeBodyTests(_InvokeBodyTests, unittest.TestCase):
+    use_stdlib = False
+
+
+class InvokeBodyStdlibTests(_InvokeBodyTests, unittest.TestCase):
+    use_stdlib = True
+
+
+class _MessageBodyTests(_BodyTests):
+    def assert_matches_generic(self, client, text):
+        payload = client._message_payload(text, None, None)
+        body = client._message_body(text)
+        self.assertIsInstance(body, bytes)
+        self.assertEqual(json.loads(body), self.generic_body(client, "message", payload))
+
+    def test_matches_generic_envelope(self):
+        for alias in [None, "bot"] + TRICKY_STRINGS:
+            client = self.make_client(default_alias=alias)
+            for text in TRICKY_STRINGS + ["  padded  "]:
+                with self.subTest(alias=alias, text=text):
+                    self.assert_matches_generic(client, text)
+
+    def test_default_alias_change_rebuilds_envelope(self):
+        client = self.make_client(default_alias="first")
+        client.default_alias = 'sec"ond \u00e9'
+        self.assert_matches_generic(client, "hello")
+        payload = json.loads(client._message_body("hello"))["payload"]
+        self.assertEqual(payload["alias"], 'sec"ond \u00e9')
+        client.default_alias = None
+        self.assertNotIn("alias", json.loads(client._message_body("hello"))["payload"])
+
+
+class MessageBodyTests(_MessageBodyTests, unittest.TestCase):
+    use_stdlib = False
+
+
+class MessageBodyStdlibTests(_MessageBodyTests, unittest.TestCase):
+    use_stdlib = True
+
+
+@unittest.skipIf(client_module.cbor2 is None, "cbor2 is not installed")
+class CborBodyTests(unittest.TestCase):
+    def setUp(self):
+        self.client = StayHereWebhookClient(wire_format="cbor")
+        self.addCleanup(self.client.close)
+
+    def test_invoke_body_is_cbor_envelope(self):
+        for action in ("message", "custom"):
+            payload = {"text": TRICKY_STRINGS[3]}
+            with self.subTest(action=action):
+                body = self.client._invoke_body(action, payload)
+                self.assertEqual(
+                    client_module.cbor2.loads(body), {"action": action, "payload": payload}
+                )
+
+    def test_message_body_is_cbor_envelope(self):
+        self.client.default_alias = TRICKY_STRINGS[0]
+        body = self.client._message_body(TRICKY_STRINGS[3])
+        self.assertEqual(
+            client_module.cbor2.loads(body),
+            {
+                "action": "message",
+                "payload": {"text": TRICKY_STRINGS[3], "alias": TRICKY_STRINGS[0]},
+            },
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()